@@ -10,13 +10,26 @@
 # can be found at: http://creativecommons.org/licenses/by-sa/4.0/legalcode
 
 import os
+import sys
+import csv
+import html
 import unicodedata
 import requests
+from urllib.parse import quote, urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import bisect
 import inflect
 import logging
 import time
-import pandas as pd
+import json
+import sqlite3
+import zlib
+import functools
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 
@@ -27,6 +40,13 @@ WHP_NCT_UNKNOWN = 'unknown'
 
 # -----------------------------------------------------------------------------
 # Helper functions
+RE_MULTI_SPACE = re.compile(' {2,}')
+# runs of spaces mixed with the whitespace-like characters found in html pages
+# (line breaks are not part of it, they are kept)
+RE_HTML_SPACES = re.compile('[ \t\r\xa0\u2009\u200b\u2028\u2029]+')
+# a tag, what is left after removing them is the text of an html fragment
+RE_HTML_TAG = re.compile('<[^>]*>')
+
 def str_normalize_whitespace(mystring):
     """
     This function removes all non-space characters from a string and then joins
@@ -55,24 +75,23 @@ def str_merge_whitespaces(mystring):
             to be merged and freed of extra whitespace.
 
     Returns:
-        str: The output returned by this function is the original string with all
-        adjacent whitespace characters (spaces and tabs) reduced to a single space.
+        str: The output returned by this function is the stripped string with every
+        run of two or more spaces reduced to a single space (tabs and line breaks
+        are kept).
 
     """
-    mystring = mystring.strip()  # the while loop will leave a trailing space,
-                                 # so the trailing whitespace must be dealt with
-                                 # before or after the while loop
-    while '  ' in mystring:
-        mystring = mystring.replace('  ', ' ')
-    return mystring
+    # one pass over the string, a replace() loop re-scans and copies it
+    # once for every halving of the longest run of spaces
+    return RE_MULTI_SPACE.sub(' ', mystring.strip())
 
 def preprocess_text(txt, keep_line_breaker = True):
-    # we can also replace, but unicode lib is a much better way
-    # x['text'] = x['text']replace(u'\xa0', u' ')
+    # the page is html, so only a handful of whitespace characters need to be
+    # taken care of here; running NFKD over the whole page was the most expensive
+    # step, it is applied to the extracted words instead, see postprocess_text
     """
     This function preprocesses text by performing the following operations:
-    1/ Normalizing the text to NFKD (NF Kalman Decomposition) using `unicodedata`.
-    2/ Removing whitespace characters other than ASCII spaces using `str_merge_whitespaces`.
+    1/ Turning the whitespace characters in `RE_HTML_SPACES` into ASCII spaces.
+    2/ Merging runs of spaces into a single space.
     3/ If `keep_line_breaker` is `True`, the function returns the normalized text
     with line breaks preserved; otherwise it removes line breaks.
 
@@ -85,14 +104,457 @@ def preprocess_text(txt, keep_line_breaker = True):
         str: The output returned by this function is a string with normalized whitespaces.
 
     """
-    txt = unicodedata.normalize('NFKD', txt)
     if keep_line_breaker:
-        return str_merge_whitespaces(txt)
+        return RE_HTML_SPACES.sub(' ', txt).strip()
     else:
+        # split() already breaks on every unicode whitespace
         return str_normalize_whitespace(txt)
 
+def postprocess_text(txt):
+    """
+    This function turns a word extracted from a page into plain text: html
+    character references such as `&#39;` or `&amp;` are decoded, the same as an
+    html parser would, then the word is normalized to NFKD (Normalization Form
+    Compatibility Decomposition) using `unicodedata`.
+
+    Args:
+        txt (str): The `txt` input parameter is the word taken out of the page,
+            e.g. a base or a plural.
+
+    Returns:
+        str: The output returned by this function is the normalized word.
+
+    """
+    txt = html.unescape(txt)
+    # NFKD leaves ascii as it is, and most words are ascii
+    if txt.isascii():
+        return txt
+    return unicodedata.normalize('NFKD', txt)
+
+# possessive quantifiers are supported by re since python 3.11
+RE_POSSESSIVE = sys.version_info >= (3, 11)
+
+def re_compile_words(pattern):
+    """
+    This function compiles a pattern whose words are captured with `([^<]*)`.
+    A captured word is always followed by a tag, so giving characters back can
+    never lead to a match; where supported the captures are made possessive so
+    the engine does not backtrack into them when the rest of the pattern fails.
+
+    Args:
+        pattern (str): The `pattern` input parameter is the regular expression.
+
+    Returns:
+        re.Pattern: The output returned by this function is the compiled pattern.
+
+    """
+    if RE_POSSESSIVE:
+        pattern = pattern.replace('([^<]*)', '([^<]*+)')
+    return re.compile(pattern)
+
+# -----------------------------------------------------------------------------
+# http
+# all look-ups share one session, so the TCP and TLS connections to the
+# dictionaries are kept alive and reused instead of set up for every word
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                                           max_retries=Retry(total=3, backoff_factor=0.3)))
+# requests already keeps the connection alive and asks for compressed pages,
+# gzip/deflate, and brotli as well when the brotli package is installed (asking
+# for it without the package would leave pages undecodable); the dictionaries
+# are only told who is asking
+HTTP_SESSION.headers['User-Agent'] = ('Plurals-and-Countable '
+    '(+https://github.com/Dictionary-video/Plurals-and-Countable) '
+    + requests.utils.default_user_agent())
+HTTP_TIMEOUT = (5, 15) # seconds to connect, seconds to read
+# pages are read in chunks and no more than HTTP_MAX_PAGE_SIZE characters are
+# kept, the dictionary pages are well below it
+HTTP_CHUNK_SIZE = 65536
+HTTP_MAX_PAGE_SIZE = 1 << 20
+# a host listed here is not hit more often than once every so many seconds,
+# however many threads are looking words up
+HTTP_MIN_INTERVAL = {'www.wordhippo.com': 1.0}
+HTTP_RATE_LOCK = threading.Lock()
+http_rate_locks = {}
+http_last_request = {}
+
+def http_wait_turn(host):
+    """
+    This function blocks until at least `HTTP_MIN_INTERVAL[host]` seconds have
+    passed since the previous request to `host`, then claims the current slot.
+    A host without an interval is not waited for.
+
+    Args:
+        host (str): The `host` input parameter is the host name of the page about
+            to be requested.
+
+    """
+    min_interval = HTTP_MIN_INTERVAL.get(host)
+    if not min_interval:
+        return
+    with HTTP_RATE_LOCK:
+        lock = http_rate_locks.setdefault(host, threading.Lock())
+    with lock:
+        wait = http_last_request.get(host, float('-inf')) + min_interval - time.monotonic()
+        if wait > 0:
+            logging.debug('sleep for %.2f seconds between requests to %s' % (wait, host))
+            time.sleep(wait)
+        http_last_request[host] = time.monotonic()
+
+def http_get(url, stop_marker = None):
+    """
+    This function downloads a page with the shared `HTTP_SESSION`. The body is
+    streamed, so the download stops as soon as `stop_marker` shows up or the page
+    grows over `HTTP_MAX_PAGE_SIZE` characters. Requests to a host listed in
+    `HTTP_MIN_INTERVAL` are spaced out. A whole page sent with an ETag or a
+    Last-Modified header is kept in the cache, the next request for it is made
+    conditional and a 304 answer returns the kept page.
+
+    Args:
+        url (str): The `url` input parameter is the address of the page.
+        stop_marker (str): The `stop_marker` input parameter is a string after
+            which the rest of the page is not needed, e.g. the heading of a
+            "word not found" page.
+
+    Returns:
+        str: The output returned by this function is the page source, or None if
+        the page cannot be downloaded.
+
+    """
+    # a page we kept is only sent again if it changed since
+    cached = cache_get_page(url)
+    headers = {}
+    if cached is not None:
+        if cached[0]:
+            headers['If-None-Match'] = cached[0]
+        if cached[1]:
+            headers['If-Modified-Since'] = cached[1]
+    chunks = []
+    complete = True
+    http_wait_turn(urlsplit(url).hostname)
+    try:
+        with HTTP_SESSION.get(url, headers = headers, timeout = HTTP_TIMEOUT, stream = True) as response:
+            if response.status_code == 304 and cached is not None:
+                return cached[2]
+            if response.status_code != 200:
+                logging.error(url + ' response: status_code[%d]' % response.status_code)
+                return None
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            size = 0
+            tail = ''
+            for chunk in response.iter_content(HTTP_CHUNK_SIZE, decode_unicode = True):
+                chunks.append(chunk)
+                size += len(chunk)
+                if stop_marker is not None:
+                    # the marker may be split between two chunks
+                    if stop_marker in chunk or stop_marker in tail + chunk[:len(stop_marker)]:
+                        complete = False
+                        break
+                    tail = (tail + chunk[-len(stop_marker):])[-len(stop_marker):]
+                if size > HTTP_MAX_PAGE_SIZE:
+                    logging.warning(url + ' is cut off at %d characters' % size)
+                    complete = False
+                    break
+    except requests.RequestException as e:
+        logging.error(url + ' request failed: %s' % e)
+        return None
+    page_src = ''.join(chunks)
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    # a page cut short cannot stand in for the whole page later
+    if complete and (etag or last_modified):
+        cache_put_page(url, etag, last_modified, page_src)
+    return page_src
+
+# -----------------------------------------------------------------------------
+# cache
+# the dictionary pages rarely change, so what we get out of them is kept in
+# memory and in a sqlite file, keyed by site and query; the pages themselves
+# are kept too, so an expired result costs a conditional request that is
+# usually answered "304 Not Modified"; set CACHE_PATH to None to keep results
+# in memory only
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'plurals_countable.sqlite')
+CACHE_TTL = 30 * 86400 # seconds a result on disk stays valid
+CACHE_MEMORY_SIZE = 4096 # results kept in memory for each site, least recently used go first
+CACHE_LOCK = threading.Lock()
+cache_db = None
+
+def cache_connect():
+    """
+    This function opens the sqlite cache the first time it is needed.
+
+    Returns:
+        sqlite3.Connection: The output returned by this function is the shared
+        connection, or None if there is no disk cache.
+
+    """
+    global cache_db
+    if cache_db is None and CACHE_PATH:
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok = True)
+            cache_db = sqlite3.connect(CACHE_PATH, check_same_thread = False)
+            cache_db.execute('CREATE TABLE IF NOT EXISTS lookup (site TEXT, query TEXT, '
+                             'json TEXT, ts INTEGER, PRIMARY KEY (site, query))')
+            cache_db.execute('CREATE TABLE IF NOT EXISTS page (url TEXT PRIMARY KEY, '
+                             'etag TEXT, last_modified TEXT, body BLOB, ts INTEGER)')
+        except (OSError, sqlite3.Error) as e:
+            logging.warning('cache %s is not available: %s' % (CACHE_PATH, e))
+            cache_db = None
+    return cache_db
+
+def cache_get(site, query):
+    """
+    This function reads a look-up result from the sqlite cache.
+
+    Args:
+        site (str): The `site` input parameter is the look-up the result came
+            from, e.g. 'webster'.
+        query (str): The `query` input parameter is the word looked up.
+
+    Returns:
+        str: The output returned by this function is the result as json, or None
+        if it is not cached or older than `CACHE_TTL`.
+
+    """
+    with CACHE_LOCK:
+        db = cache_connect()
+        if db is None:
+            return None
+        try:
+            row = db.execute('SELECT json FROM lookup WHERE site = ? AND query = ? AND ts >= ?',
+                             (site, query, int(time.time()) - CACHE_TTL)).fetchone()
+        except sqlite3.Error as e:
+            logging.warning('cache read failed: %s' % e)
+            return None
+    return row[0] if row else None
+
+def cache_put(site, query, found):
+    """
+    This function writes a look-up result to the sqlite cache.
+
+    Args:
+        site (str): The `site` input parameter is the look-up the result came from.
+        query (str): The `query` input parameter is the word looked up.
+        found (str): The `found` input parameter is the result as json.
+
+    """
+    with CACHE_LOCK:
+        db = cache_connect()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute('INSERT OR REPLACE INTO lookup VALUES (?, ?, ?, ?)',
+                           (site, query, found, int(time.time())))
+        except sqlite3.Error as e:
+            logging.warning('cache write failed: %s' % e)
+
+def cache_get_page(url):
+    """
+    This function reads a page kept from an earlier download, with the validators
+    the server sent for it.
+
+    Args:
+        url (str): The `url` input parameter is the address of the page.
+
+    Returns:
+        tuple: The output returned by this function is (etag, last_modified, page
+        source), or None if the page is not kept.
+
+    """
+    with CACHE_LOCK:
+        db = cache_connect()
+        if db is None:
+            return None
+        try:
+            row = db.execute('SELECT etag, last_modified, body FROM page WHERE url = ?',
+                             (url,)).fetchone()
+        except sqlite3.Error as e:
+            logging.warning('cache read failed: %s' % e)
+            return None
+    if row is None:
+        return None
+    try:
+        return row[0], row[1], zlib.decompress(row[2]).decode('utf-8')
+    except (zlib.error, UnicodeDecodeError) as e:
+        logging.warning('cached page of %s is damaged: %s' % (url, e))
+        return None
+
+def cache_put_page(url, etag, last_modified, page_src):
+    """
+    This function keeps a downloaded page, compressed, so it can be revalidated
+    with a conditional request instead of downloaded again.
+
+    Args:
+        url (str): The `url` input parameter is the address of the page.
+        etag (str): The `etag` input parameter is the ETag header of the page.
+        last_modified (str): The `last_modified` input parameter is the
+            Last-Modified header of the page.
+        page_src (str): The `page_src` input parameter is the page source.
+
+    """
+    body = zlib.compress(page_src.encode('utf-8'))
+    with CACHE_LOCK:
+        db = cache_connect()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute('INSERT OR REPLACE INTO page VALUES (?, ?, ?, ?, ?)',
+                           (url, etag, last_modified, body, int(time.time())))
+        except sqlite3.Error as e:
+            logging.warning('cache write failed: %s' % e)
+
+def cached_lookup(site, persist = True):
+    """
+    This function makes a decorator that caches the results of a look-up
+    function, first in memory then on disk. Only results are cached, a look-up
+    that returns None is tried again next time.
+
+    Args:
+        site (str): The `site` input parameter names the look-up in the cache.
+        persist (bool): The `persist` input parameter is False for a look-up
+            that is as fast as reading the disk, its results are only kept in
+            memory.
+
+    Returns:
+        function: The output returned by this function is the decorator.
+
+    """
+    def decorator(lookup):
+        # least recently used first; look-ups run on many threads, so the
+        # memory is only touched under its lock (never held during a look-up)
+        memory = collections.OrderedDict()
+        memory_lock = threading.Lock()
+
+        @functools.wraps(lookup)
+        def wrapper(noun_lookup):
+            query = noun_lookup.strip()
+            with memory_lock:
+                found = memory.get(query)
+                if found is not None:
+                    memory.move_to_end(query)
+            if found is None:
+                found = cache_get(site, query) if persist else None
+                if found is None:
+                    ret = lookup(query)
+                    if ret is None:
+                        return None
+                    found = json.dumps(ret)
+                    if persist:
+                        cache_put(site, query, found)
+                with memory_lock:
+                    memory[query] = found
+                    memory.move_to_end(query)
+                    if len(memory) > CACHE_MEMORY_SIZE:
+                        memory.popitem(last = False)
+            # every caller gets its own copy, they are free to change it
+            return json.loads(found)
+        return wrapper
+    return decorator
+
 # -----------------------------------------------------------------------------
 # webster look-up
+
+# patterns are compiled once at import time, the finders below are called
+# on every page we download
+WBS_H1_OPEN = '<h1'
+WBS_H1_WORD_OPEN = '<h1 class="hword">'
+WBS_RE_ORIGINAL = re_compile_words(r'<span class="cxl">plural of</span> *<a href="[^"]*" class="cxt"><span class="text-uppercase">([^<]*)</span></a>')
+
+# constant strings that flag a page or start a plural pattern, they are located
+# once per page and the result is shared by all the finders below
+WBS_ANCHOR_MISPELLED = '<h1 class="mispelled-word">'
+WBS_ANCHOR_2CONSTRCT = 'plural in form but singular or plural in construction'
+WBS_ANCHOR_PLURAL = 'plural&#32;</span><span class="if">'
+WBS_ANCHOR_OR = '<span class="il "> or&#32;</span><span class="if">'
+WBS_ANCHOR_ALSO = '<span class="il "> also&#32;</span><span class="if">'
+WBS_ANCHOR_PLURAL_ALSO = '> plural also&#32;</span><span class="if">'
+WBS_ANCHORS = (WBS_ANCHOR_MISPELLED, WBS_ANCHOR_2CONSTRCT, WBS_ANCHOR_PLURAL,
+               WBS_ANCHOR_OR, WBS_ANCHOR_ALSO, WBS_ANCHOR_PLURAL_ALSO)
+# these anchors open a <span class="if"> holding a word
+WBS_WORD_ANCHORS = (WBS_ANCHOR_PLURAL, WBS_ANCHOR_OR, WBS_ANCHOR_ALSO, WBS_ANCHOR_PLURAL_ALSO)
+# a word followed, after its pronunciation or a space, by this badge is a plural
+# of the word (see webster_find_plural2)
+WBS_IF_OPEN = '<span class="if">'
+WBS_PLURAL_BADGE = '<span class="spl plural badge mw-badge-gray-100 text-start text-wrap d-inline"> plural</span>'
+# the pronunciation that follows a "plural also" form
+WBS_PRT_A = '<span class="prt-a">'
+# the most characters allowed between a plural and the "or"/"also" form after it
+WBS_PLURAL_GAP = 2000
+
+def webster_scan_anchors(txt):
+    """
+    This function records where each of the constant strings in `WBS_ANCHORS`
+    occurs in the page, together with the word that follows the anchors in
+    `WBS_WORD_ANCHORS`, so the finders do not have to search the page again.
+
+    Args:
+        txt (str): The `txt` input parameter is the preprocessed page source.
+
+    Returns:
+        dict: The output returned by this function maps every anchor in
+        `WBS_ANCHORS` to a list of spans in page order. A span is a tuple of
+        (start, end, word); for a word anchor the span ends after the word's
+        </span>, and word is None when the anchor is not followed by a word
+        closed by </span> or is not a word anchor.
+
+    """
+    anchors = {}
+    for anchor in WBS_ANCHORS:
+        spans = []
+        pos = txt.find(anchor)
+        while pos != -1:
+            end = pos + len(anchor)
+            word = None
+            if anchor in WBS_WORD_ANCHORS:
+                close = txt.find('<', end)
+                if close != -1 and txt.startswith('</span>', close):
+                    word = txt[end:close]
+                    end = close + len('</span>')
+            spans.append((pos, end, word))
+            pos = txt.find(anchor, pos + len(anchor))
+        anchors[anchor] = spans
+    return anchors
+
+def webster_words(spans):
+    """
+    This function keeps the spans of `webster_scan_anchors` that hold a word.
+
+    Args:
+        spans (list): The `spans` input parameter is the list of spans of one anchor.
+
+    Returns:
+        list: The output returned by this function is the spans with a word.
+
+    """
+    return [span for span in spans if span[2] is not None]
+
+def webster_words_after(txt, spans, end):
+    """
+    This function returns the spans holding a word that start no more than
+    `WBS_PLURAL_GAP` characters (and no line break) after `end`, nearest
+    first. This is the order in which a lazy `.{0,2000}?` gap would try them.
+
+    Args:
+        txt (str): The `txt` input parameter is the preprocessed page source.
+        spans (list): The `spans` input parameter is the list of spans of one
+            anchor, e.g. all the "or" forms of the page.
+        end (int): The `end` input parameter is where the previous form ends.
+
+    Returns:
+        list: The output returned by this function is the spans that follow.
+
+    """
+    found = []
+    for span in spans[bisect.bisect_left(spans, (end,)):]:
+        if span[0] - end > WBS_PLURAL_GAP or txt.find('\n', end, span[0]) != -1:
+            break
+        if span[2] is not None:
+            found.append(span)
+    return found
+
 def webster_find_h1_word(text):
     # pattern: <h1 class="hword">foot</h1>
     """
@@ -107,15 +569,26 @@ def webster_find_h1_word(text):
         str: The output returned by this function is `None`.
 
     """
-    h1_word = re.findall(r'<h1 class="hword">(.*?)</h1>', text)
-
-    if len(h1_word) > 0:
-        return h1_word[0]
-    else:
-        return None
+    # both tags are constant strings, str.find is all it takes to get the word
+    # between them; like (.*?) the word cannot run over a line break
+    start = text.find(WBS_H1_WORD_OPEN)
+    while start != -1:
+        start += len(WBS_H1_WORD_OPEN)
+        end = text.find('</h1>', start)
+        if end == -1:
+            return None
+        if text.find('\n', start, end) == -1:
+            word = text[start:end]
+            if '<' in word:
+                # the heading may hold markup around the word, we only
+                # want its text, e.g. <h1 class="hword"><em>foot</em></h1>
+                word = RE_HTML_TAG.sub('', word)
+            return word
+        start = text.find(WBS_H1_WORD_OPEN, start)
+    return None
 
 # webster does not recognize this word or it's mispelled
-def webster_is_mispelled(web_src):
+def webster_is_mispelled(web_src, anchors = None):
     # <h1 class="mispelled-word">&ldquo;duckss&rdquo;</h1>
     """
     This function takes a string as input (web_src) and returns true if it contains
@@ -125,17 +598,71 @@ def webster_is_mispelled(web_src):
         web_src (str): The `web_src` input parameter is passed as an argument to
             the function and serves as a string of HTML code that is checked for
             misspellings using the provided regular expression.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors` if the page has been scanned already.
 
     Returns:
         str: The function takes a string `web_src` as input and checks if it
         contains the word "<h1 class="mispelled-word">" anywhere inside it.
 
     """
-    if web_src.find('<h1 class="mispelled-word">') != -1:
+    if anchors is not None:
+        return len(anchors[WBS_ANCHOR_MISPELLED]) > 0
+    if web_src.find(WBS_ANCHOR_MISPELLED) != -1:
         return True
     else:
         return False
 
+def webster_parse(page_src):
+    """
+    This function reads everything `webster_lookup` needs from a Webster page.
+    It does not go to the web, so the same page always gives the same result.
+
+    Args:
+        page_src (str): The `page_src` input parameter is the page source as
+            downloaded.
+
+    Returns:
+        dict: The output returned by this function is a dictionary with the
+        following keys:
+
+        	- `mispelled`: True if webster does not know the word.
+        	- `orig`: The singular the page says the word is a plural of, or None.
+        	- `h1_word`: The word enclosed by the html h1 tag, or None.
+        	- `plurals`: A list of plural forms found on the page, or None.
+        	- `wbs_2constrct`: True if the word is plural in form but singular or
+        plural in construction.
+
+        The words are normalized with `postprocess_text`.
+
+    """
+    # everything we read (the heading, the plurals, "plural of") comes after the
+    # first heading; the <head>, scripts and menus before it are not processed
+    start = page_src.find(WBS_H1_OPEN)
+    if start > 0:
+        page_src = page_src[start:]
+
+    # remove all line breaker
+    # https://stackoverflow.com/questions/16566268/remove-all-line-breaks-from-a-long-string-of-text
+    # page_src = page_src.replace('\n', ' ').replace('\r', '')
+    page_src = preprocess_text(page_src, keep_line_breaker = False)
+    anchors = webster_scan_anchors(page_src)
+
+    parsed = {}
+    parsed['mispelled'] = webster_is_mispelled(page_src, anchors)
+    orig = webster_original(page_src)
+    parsed['orig'] = postprocess_text(orig) if orig else None
+    # h1 word is the word enclosed by html h1 tag
+    h1_word = webster_find_h1_word(page_src)
+    parsed['h1_word'] = postprocess_text(h1_word) if h1_word is not None else None
+    plurals = webster_find_plurals(page_src, anchors)
+    if plurals is not None:
+        plurals = [postprocess_text(plural) for plural in plurals]
+    parsed['plurals'] = plurals
+    parsed['wbs_2constrct'] = len(anchors[WBS_ANCHOR_2CONSTRCT]) > 0
+    return parsed
+
+@cached_lookup('webster')
 def webster_lookup(noun_lookup):
     """
     This function takes a noun string as input and uses the Merriam-Webster API
@@ -164,38 +691,37 @@ def webster_lookup(noun_lookup):
     # faux pas is a noun, so it is not one word noun anymore
     # if ' ' in noun_lookup:
     #     return None
-    noun_lookup = noun_lookup.replace(' ', '%20')
-    url = 'https://www.merriam-webster.com/dictionary/%s' % noun_lookup
-    response = requests.get(url)
-    if response.status_code != 200:
-        logging.error(url + ' response: status_code[%d]' % response.status_code)
+    # quote every unsafe character (faux pas, château, ...), and keep
+    # noun_lookup as it is since it goes back to the caller as query
+    url = 'https://www.merriam-webster.com/dictionary/%s' % quote(noun_lookup, safe = '')
+    # a page for an unknown word is not read past its heading
+    page_src = http_get(url, stop_marker = WBS_ANCHOR_MISPELLED)
+    if page_src is None:
         return None
-    
-    page_src = response.text
-    # remove all line breaker
-    # https://stackoverflow.com/questions/16566268/remove-all-line-breaks-from-a-long-string-of-text
-    # page_src = page_src.replace('\n', ' ').replace('\r', '')
-    page_src = preprocess_text(page_src, keep_line_breaker = False)
 
-    if webster_is_mispelled(page_src):
+    parsed = webster_parse(page_src)
+    if parsed['mispelled']:
         return None
+    plurals = parsed['plurals']
 
     # what we lookup is already a plural, we are told the original singular as orig
-    orig = webster_original(page_src)
+    orig = parsed['orig']
     if orig:
-        ret = webster_lookup(orig)
-        # overwrite
-        ret['query'] = noun_lookup
-        ret['base'] = orig
-        return ret
-    
-    # h1 word is the word enclosed by html h1 tag
-    h1_word = webster_find_h1_word(page_src)
-    plurals = webster_find_plurals(page_src)
+        # the page of a plural usually lists it with the plurals of its singular,
+        # e.g. feet and foot, then the page of the singular is not fetched
+        if not plurals or postprocess_text(noun_lookup) not in plurals:
+            ret = webster_lookup(orig)
+            # overwrite
+            ret['query'] = noun_lookup
+            ret['base'] = orig
+            return ret
+        h1_word = orig
+    else:
+        h1_word = parsed['h1_word']
 
     ret = {}
     ret['query'] = noun_lookup
-    if page_src.find('plural in form but singular or plural in construction') != -1:
+    if parsed['wbs_2constrct']:
         ret['wbs_2constrct'] = True
     # webster's base word is always h1 word
     # query can be redirected to base e.g. desks -> desk on webster
@@ -224,15 +750,15 @@ def webster_original(txt):
         list: The output returned by this function is `None`.
 
     """
-    p1 = r'<span class="cxl">plural of</span> *<a href="[^"]*" class="cxt"><span class="text-uppercase">([^<]*)</span></a>'
-    found = re.findall(p1, txt)
-    if len(found) > 0:
-        return found[0]
+    # only the first match is used, the search stops there
+    found = WBS_RE_ORIGINAL.search(txt)
+    if found:
+        return found.group(1)
     else:
         return None
 
 # at this point we know for sure we are reading a base_noun page
-def webster_find_plurals(txt):
+def webster_find_plurals(txt, anchors = None):
     """
     This function takes a string `txt` and returns its plural form according to
     Webster's rules. If no plural form is found using webster's rules the function
@@ -245,6 +771,8 @@ def webster_find_plurals(txt):
             phrase based on different rules and conventions. The output of these
             functions is then used to construct the final plural form of the input
             text. In essence.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors`, the page is scanned here if it is not given.
 
     Returns:
         list: The output returned by this function is a list of strings. If any
@@ -252,27 +780,35 @@ def webster_find_plurals(txt):
         of those words will be returned.
 
     """
-    rslt = webster_find_plural_a_or_b_also_c(txt)
-    if rslt is not None:
-        return rslt
-    
-    aorb = webster_find_plural_a_or_b(txt)
-    if aorb is not None:
-        plural_also = webster_find_plural_also(txt)
-        if plural_also:
-            final = aorb + plural_also
-            final_set = set(final)
-            return list(final_set) # we always return list
-        else:
-            return aorb
-    
-    aalsob = webster_find_plural_a_also_b(txt)
-    if aalsob is not None:
-        return aalsob  # forgot about other also, too much
-    
-    plu = webster_find_plural(txt)
-    if plu is not None:
-        return plu
+    if anchors is None:
+        anchors = webster_scan_anchors(txt)
+
+    # every rule below starts at a "plural" form, a page without one (e.g. an
+    # uncountable noun) goes straight to the badge rule
+    if webster_words(anchors[WBS_ANCHOR_PLURAL]):
+        if anchors[WBS_ANCHOR_OR]:
+            if anchors[WBS_ANCHOR_ALSO]:
+                rslt = webster_find_plural_a_or_b_also_c(txt, anchors)
+                if rslt is not None:
+                    return rslt
+
+            aorb = webster_find_plural_a_or_b(txt, anchors)
+            if aorb is not None:
+                plural_also = webster_find_plural_also(txt, anchors)
+                if plural_also:
+                    final = aorb + plural_also
+                    return list(dict.fromkeys(final)) # we always return list, in page order
+                else:
+                    return aorb
+
+        if anchors[WBS_ANCHOR_ALSO]:
+            aalsob = webster_find_plural_a_also_b(txt, anchors)
+            if aalsob is not None:
+                return aalsob  # forgot about other also, too much
+
+        plu = webster_find_plural(txt, anchors)
+        if plu is not None:
+            return plu
 
     plu2 = webster_find_plural2(txt)
     if plu2 is not None:
@@ -282,7 +818,7 @@ def webster_find_plurals(txt):
     return None
 
 # https://www.merriam-webster.com/dictionary/woman
-def webster_find_plural(txt):
+def webster_find_plural(txt, anchors = None):
     """
     This function takes a string `txt` as input and returns an array of strings
     representing the plural forms found within `txt`. It uses regular expressions
@@ -292,20 +828,19 @@ def webster_find_plural(txt):
     Args:
         txt (str): The `txt` input parameter is the text that needs to be checked
             for plurals.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors`, the page is scanned here if it is not given.
 
     Returns:
         list: The output returned by this function is a list containing the first
         occurrence of the word with its plural form.
 
     """
-    p1 = r'plural&#32;</span><span class="if">([^<]*)</span>.*?'
-    found = re.findall(p1, txt)
-    if len(found) > 0:
-        ret = []
-        ret.append(found[0])
-        return ret
-    else:
-        return None
+    if anchors is None:
+        anchors = webster_scan_anchors(txt)
+    for plural in webster_words(anchors[WBS_ANCHOR_PLURAL]):
+        return [plural[2]]
+    return None
 
 # https://www.merriam-webster.com/dictionary/water
 def webster_find_plural2(txt):
@@ -319,24 +854,41 @@ def webster_find_plural2(txt):
 
     Returns:
         list: The output returned by this function is a list of all words found
-        with the pattern '<span class="if">([^<]*)</span>(<span class="prt-a">| ).{0.
-        .
+        with the pattern '<span class="if">([^<]*)</span>(<span class="prt-a">| )'
+        followed by the plural badge.
 
     """
-    p1 = '<span class="if">([^<]*)</span>(<span class="prt-a">| ).{0,2000}?<span class="spl plural badge mw-badge-gray-100 text-start text-wrap d-inline"> plural</span>'
-    found = re.findall(p1, txt)
-
-    new_found = []
-    for item in found:
-        if ' ' not in item[0]:
-            new_found.append(item[0])
-
-    set_found = set(new_found)
-    lst_ret = list(set_found)
-    return lst_ret
+    if WBS_PLURAL_BADGE not in txt:
+        return []
+    # pattern: <span class="if">word</span>(<span class="prt-a">| ) then the
+    # nearest badge no more than WBS_PLURAL_GAP characters (and no line break)
+    # after; the badge is looked for in that window only, there is no
+    # backtracking over the page as with a lazy .{0,2000}? gap
+    found = []
+    pos = txt.find(WBS_IF_OPEN)
+    while pos != -1:
+        start = pos + len(WBS_IF_OPEN)
+        close = txt.find('<', start)
+        if close != -1 and txt.startswith('</span>', close):
+            gap = close + len('</span>')
+            if txt.startswith(WBS_PRT_A, gap):
+                gap += len(WBS_PRT_A)
+            elif txt.startswith(' ', gap):
+                gap += 1
+            else:
+                gap = -1
+            if gap != -1:
+                badge = txt.find(WBS_PLURAL_BADGE, gap, gap + WBS_PLURAL_GAP + len(WBS_PLURAL_BADGE))
+                if badge != -1 and txt.find('\n', gap, badge) == -1:
+                    found.append(txt[start:close])
+                    pos = txt.find(WBS_IF_OPEN, badge + len(WBS_PLURAL_BADGE))
+                    continue
+        pos = txt.find(WBS_IF_OPEN, pos + 1)
+    # dict keeps the first plural found first, a set would shuffle them
+    return list(dict.fromkeys(word for word in found if ' ' not in word))
 
 # https://www.merriam-webster.com/dictionary/foot
-def webster_find_plural_a_also_b(txt):
+def webster_find_plural_a_also_b(txt, anchors = None):
     """
     This function searches for plural forms of words within a given text using
     regular expressions. It first searches for <span class="if"> patterns and then
@@ -347,22 +899,23 @@ def webster_find_plural_a_also_b(txt):
     Args:
         txt (str): The `txt` input parameter is the text that the function will
             search for plural forms of words.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors`, the page is scanned here if it is not given.
 
     Returns:
         list: The output returned by this function is `None`.
 
     """
-    p1 = r'plural&#32;</span><span class="if">([^<]*)</span>.{0,2000}?'
-    p2 = r'<span class="il "> also&#32;</span><span class="if">([^<]*)</span>'
-    found = re.findall(p1+p2, txt)
-    if len(found) > 0:
-        return list(found[0])
-    else:
-        return None
+    if anchors is None:
+        anchors = webster_scan_anchors(txt)
+    for plural in webster_words(anchors[WBS_ANCHOR_PLURAL]):
+        for also in webster_words_after(txt, anchors[WBS_ANCHOR_ALSO], plural[1]):
+            return [plural[2], also[2]]
+    return None
 
 # https://www.merriam-webster.com/dictionary/cactus
 # should be very rare
-def webster_find_plural_a_or_b_also_c(txt):
+def webster_find_plural_a_or_b_also_c(txt, anchors = None):
     # plural&#32;</span><span class="if">cacti</span><span class="prt-a">
     # or&#32;</span><span class="if">cactuses</span><span class="il ">
     # also&#32;</span><span class="if">cactus</span>
@@ -379,6 +932,8 @@ def webster_find_plural_a_or_b_also_c(txt):
     Args:
         txt (str): The `txt` input parameter is the string that the function
             processes to find plural forms of words.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors`, the page is scanned here if it is not given.
 
     Returns:
         list: The output returned by the `webster_find_plural_a_or_b_also_c`
@@ -386,22 +941,23 @@ def webster_find_plural_a_or_b_also_c(txt):
         text.
 
     """
-    p1 = r'plural&#32;</span><span class="if">([^<]*)</span>.{0,2000}?'
-    p2 = r'<span class="il "> or&#32;</span><span class="if">([^<]*)</span>.{0,2000}?'
-    p3 = r'<span class="il "> also&#32;</span><span class="if">([^<]*)</span>'
     # DOTALL must be used to let dot include newline
     # found = re.findall(pattern, txt, flags=re.DOTALL)
     # we remove line breaker before
-    found = re.findall(p1+p2+p3, txt)
-    if len(found) > 0:
-        # found is list, but found[0] is tuple
-        return list(found[0])
-    else:
-        return None
+    # the pattern is no longer run: the plural, or and also forms all come
+    # from the anchor scan and are chained by position, which gives the same
+    # first match as plural .{0,2000}? or .{0,2000}? also
+    if anchors is None:
+        anchors = webster_scan_anchors(txt)
+    for plural in webster_words(anchors[WBS_ANCHOR_PLURAL]):
+        for or_ in webster_words_after(txt, anchors[WBS_ANCHOR_OR], plural[1]):
+            for also in webster_words_after(txt, anchors[WBS_ANCHOR_ALSO], or_[1]):
+                return [plural[2], or_[2], also[2]]
+    return None
 
 # https://www.merriam-webster.com/dictionary/octopus
 # this return list or None
-def webster_find_plural_a_or_b(txt):
+def webster_find_plural_a_or_b(txt, anchors = None):
     """
     This function searches for plural forms of words within a text and returns the
     first match. It uses regular expressions to identify plural forms denoted by
@@ -413,24 +969,24 @@ def webster_find_plural_a_or_b(txt):
     Args:
         txt (str): The `txt` input parameter is the text to search for plural forms
             of words.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors`, the page is scanned here if it is not given.
 
     Returns:
         list: The output returned by the `webster_find_plural_a_or_b` function is
         `None`.
 
     """
-    p1 = r'plural&#32;</span><span class="if">([^<]*)</span>.{0,2000}?'
-    p2 = r'<span class="il "> or&#32;</span><span class="if">([^<]*)</span>'
-    found = re.findall(p1+p2, txt)
-    if len(found) > 0:
-        # found is list, but found[0] is tuple
-        return list(found[0])
-    else:
-        return None
+    if anchors is None:
+        anchors = webster_scan_anchors(txt)
+    for plural in webster_words(anchors[WBS_ANCHOR_PLURAL]):
+        for or_ in webster_words_after(txt, anchors[WBS_ANCHOR_OR], plural[1]):
+            return [plural[2], or_[2]]
+    return None
 
 # https://www.merriam-webster.com/dictionary/octopus
 # this will return list or None
-def webster_find_plural_also(txt):
+def webster_find_plural_also(txt, anchors = None):
     """
     This function uses regular expressions to find all occurrences of the phrase
     "plural also" and any following text that is enclosed within a span tag with
@@ -443,14 +999,19 @@ def webster_find_plural_also(txt):
             The `txt` input parameter serves as the text content being analyzed
             to identify instances of "plural also" phrases and retrieve any
             corresponding singular words.
+        anchors (dict): The `anchors` input parameter is the result of
+            `webster_scan_anchors`, the page is scanned here if it is not given.
 
     Returns:
         list: The output returned by the function is a list of all plural forms
         foundin the input text. If no plural forms are found.
 
     """
-    pattern = r'> plural also&#32;</span><span class="if">([^<]*)</span><span class="prt-a">'
-    found = re.findall(pattern, txt)
+    if anchors is None:
+        anchors = webster_scan_anchors(txt)
+    # the "plural also" form counts when the pronunciation follows it
+    found = [span[2] for span in webster_words(anchors[WBS_ANCHOR_PLURAL_ALSO])
+             if txt.startswith(WBS_PRT_A, span[1])]
     if len(found) > 0:
         # found is list
         return found
@@ -459,6 +1020,68 @@ def webster_find_plural_also(txt):
 
 # -----------------------------------------------------------------------------
 # word hippo look-up
+
+# constant strings that flag a page, each is looked for once per page
+WHP_FLAG_NOT_FOUND = 'No words found.'
+WHP_FLAG_PLURAL_ONLY = '<i>plural only</i>'
+WHP_FLAG_EITHER = 'can be countable or uncountable'
+WHP_FLAG_UNCOUNTABLE = 'is <i>uncountable</i>'
+WHP_FLAGS = (WHP_FLAG_NOT_FOUND, WHP_FLAG_PLURAL_ONLY, WHP_FLAG_EITHER, WHP_FLAG_UNCOUNTABLE)
+
+WHP_ORIGINAL_OPEN = 'is the plural of <a href="/what-is/the-plural-of/'
+WHP_RE_A_OR_B = re_compile_words(r'plural form of \w* is <b><a[^>]*>([^<]*)</a></b> or <b>([^<]*)</b>')
+WHP_RE_A = re_compile_words(r'plural form of \w* is *<b><a[^>]*>([^<]*)</a></b>.')
+WHP_RE_AALSOB = re_compile_words(r'plural form will also be <b><a[^>]*>([^<]*)</a></b>.*?the plural form can also be <b><a[^>]*>([^<]*)</a></b>')
+WHP_RE_AALSOB_NO_ALSO = re_compile_words(r'plural form will be <b><a[^>]*>([^<]*)</a></b>.*?the plural form can also be <b><a[^>]*>([^<]*)</a></b>')
+WHP_RE_AALSOB2 = re_compile_words(r'is also <b><a[^>]*>([^<]*)</a></b>.*?the plural form can also be <b><a[^>]*>([^<]*)</a></b>')
+WHP_RE_ALSO_ONLY = re_compile_words('is also <b><a href="/what-is/the-meaning-of-the-word/[^>]*">([^<]*)</a></b>.')
+
+def wordhippo_parse(page_src):
+    """
+    This function reads everything `wordhippo_lookup` needs from a WordHippo page.
+    It does not go to the web, so the same page always gives the same result.
+
+    Args:
+        page_src (str): The `page_src` input parameter is the page source as
+            downloaded.
+
+    Returns:
+        dict: The output returned by this function is a dictionary with the
+        following keys:
+
+        	- `orig`: The singular the page says the word is a plural of, or None.
+        When it is found the other keys are None, the singular's page is read
+        for them.
+        	- `plurals`: A list of plural forms found on the page, or None if
+        WordHippo does not know the word.
+        	- `whp_plural_only`: True if the word is <i>plural only</i>.
+        	- `countable`: One of WHP_NCT_COUNTABLE/WHP_NCT_UNCOUNTABLE/WHP_NCT_EITHER.
+
+        The words are normalized with `postprocess_text`.
+
+    """
+    page_src = preprocess_text(page_src, keep_line_breaker = False)
+
+    parsed = {'orig': None, 'plurals': None, 'whp_plural_only': None, 'countable': None}
+    orig = wordhippo_original(page_src)
+    if orig:
+        parsed['orig'] = postprocess_text(orig)
+        return parsed
+
+    flags = wordhippo_scan_flags(page_src)
+    plurals = wordhippo_find_plurals(page_src, flags)
+    if plurals is not None:
+        parsed['plurals'] = [postprocess_text(plural) for plural in plurals]
+    parsed['whp_plural_only'] = flags[WHP_FLAG_PLURAL_ONLY]
+    if flags[WHP_FLAG_EITHER]:
+        parsed['countable'] = WHP_NCT_EITHER
+    elif flags[WHP_FLAG_UNCOUNTABLE]:
+        parsed['countable'] = WHP_NCT_UNCOUNTABLE
+    else:
+        parsed['countable'] = WHP_NCT_COUNTABLE
+    return parsed
+
+@cached_lookup('wordhippo')
 def wordhippo_lookup(noun_lookup):
     """
     This function takes a string as input (a noun to look up) and uses the WordHippo
@@ -481,19 +1104,14 @@ def wordhippo_lookup(noun_lookup):
         (one of WHP_NCT_COUNTABLE/WHP_NCT_UNCOUNTABLE/WHP_NCT_EITHER).
 
     """
-    logging.debug('sleep for one second between requests')
-    time.sleep(1)
-    if ' ' in noun_lookup:
-        noun_lookup = noun_lookup.replace(' ', '_')
-    url = 'https://www.wordhippo.com/what-is/the-plural-of/%s.html' % noun_lookup
-    response = requests.get(url)
-    if response.status_code != 200:
-        logging.error(url + ' response: status_code[%d]' % response.status_code)
+    # wordhippo joins the words of a phrase with underscores
+    url = 'https://www.wordhippo.com/what-is/the-plural-of/%s.html' % quote(noun_lookup.replace(' ', '_'), safe = '')
+    page_src = http_get(url)
+    if page_src is None:
         return None
-    page_src = response.text
-    page_src = preprocess_text(page_src, keep_line_breaker = False)
+    parsed = wordhippo_parse(page_src)
 
-    orig = wordhippo_original(page_src)
+    orig = parsed['orig']
     if orig:
         ret = wordhippo_lookup(orig)
         # overwrite
@@ -501,25 +1119,19 @@ def wordhippo_lookup(noun_lookup):
         ret['base'] = orig
         return ret
 
-    plurals = wordhippo_find_plurals(page_src)
+    plurals = parsed['plurals']
     if plurals is None:
         return None
 
     ret = {}
     ret['query'] = noun_lookup
-    if page_src.find('<i>plural only</i>') != -1:
+    if parsed['whp_plural_only']:
         ret['whp_plural_only'] = True
     # orig has been dealt with above
     ret['base'] = noun_lookup
     if len(plurals) > 0:
         ret['plural'] = plurals
-    
-    if page_src.find('can be countable or uncountable') != -1:
-        ret['countable'] = WHP_NCT_EITHER
-    elif page_src.find('is <i>uncountable</i>') != -1:
-        ret['countable'] = WHP_NCT_UNCOUNTABLE
-    else:
-        ret['countable'] = WHP_NCT_COUNTABLE
+    ret['countable'] = parsed['countable']
 
     return ret
 
@@ -536,14 +1148,35 @@ def wordhippo_original(txt):
         list: The output returned by this function is `None`.
 
     """
-    p1 = r'is the plural of <a href="/what-is/the-plural-of/[^"]*">([^<]*)</a>'
-    found = re.findall(p1, txt)
-    if len(found) > 0:
-        return found[0]
-    else:
-        return None
+    # is the plural of <a href="/what-is/the-plural-of/[^"]*">([^<]*)</a>
+    # taken apart with str.find, all of it but the link and the word is constant
+    pos = txt.find(WHP_ORIGINAL_OPEN)
+    while pos != -1:
+        href_end = txt.find('"', pos + len(WHP_ORIGINAL_OPEN))
+        if href_end != -1 and txt.startswith('">', href_end):
+            close = txt.find('<', href_end + 2)
+            if close != -1 and txt.startswith('</a>', close):
+                return txt[href_end + 2:close]
+        pos = txt.find(WHP_ORIGINAL_OPEN, pos + len(WHP_ORIGINAL_OPEN))
+    return None
+
+def wordhippo_scan_flags(txt):
+    """
+    This function tells which of the constant strings in `WHP_FLAGS` occur in the
+    page, so the look-up and the finders share one search for each of them.
+
+    Args:
+        txt (str): The `txt` input parameter is the preprocessed page source.
+
+    Returns:
+        dict: The output returned by this function maps every flag in `WHP_FLAGS`
+        to True if it is in the page.
 
-def wordhippo_find_plurals(txt):
+    """
+    # a str.find per flag beats a single regex alternation over the page by far
+    return {flag: flag in txt for flag in WHP_FLAGS}
+
+def wordhippo_find_plurals(txt, flags = None):
     """
     This function checks if any words can be found using a list of predicates
     (`wordhippo_find_a`, `wordhippo_find_b`, `wordhippo_find_also_only`, and
@@ -552,12 +1185,16 @@ def wordhippo_find_plurals(txt):
     Args:
         txt (str): The `txt` input parameter is the string that needs to be processed
             to find plurals.
+        flags (dict): The `flags` input parameter is the result of
+            `wordhippo_scan_flags`, the page is scanned here if it is not given.
 
     Returns:
         str: The output returned by this function is "None".
 
     """
-    if txt.find('No words found.') != -1:
+    if flags is None:
+        flags = wordhippo_scan_flags(txt)
+    if flags[WHP_FLAG_NOT_FOUND]:
         return None
     
     aorb = wordhippo_find_a_or_b(txt)
@@ -600,11 +1237,10 @@ def wordhippo_find_a_or_b(txt):
         or <b>([^<]*)</b>]`.
 
     """
-    p1 = r'plural form of \w* is <b><a[^>]*>([^<]*)</a></b> or <b>([^<]*)</b>'
-    # this returns list of tuple
-    found = re.findall(p1, txt)
-    if len(found) > 0:
-        return found[0]
+    # this returns a tuple
+    found = WHP_RE_A_OR_B.search(txt)
+    if found:
+        return found.groups()
     else:
         return None
 
@@ -626,8 +1262,7 @@ def wordhippo_find_a(txt):
         or an empty list if no such forms were found.
 
     """
-    p1 = r'plural form of \w* is *<b><a[^>]*>([^<]*)</a></b>.'
-    found = re.findall(p1, txt)
+    found = WHP_RE_A.findall(txt)
     if len(found) > 0:
         return found
     else:
@@ -649,16 +1284,14 @@ def wordhippo_find_aalsob(txt):
         list: The output returned by this function is `None`.
 
     """
-    p1 = r'plural form will also be <b><a[^>]*>([^<]*)</a></b>.*?the plural form can also be <b><a[^>]*>([^<]*)</a></b>'
-    found = re.findall(p1, txt)
-    if len(found) > 0:
-        return list(found[0])
+    found = WHP_RE_AALSOB.search(txt)
+    if found:
+        return list(found.groups())
 
     # no also
-    p1 = r'plural form will be <b><a[^>]*>([^<]*)</a></b>.*?the plural form can also be <b><a[^>]*>([^<]*)</a></b>'
-    found = re.findall(p1, txt)
-    if len(found) > 0:
-        return list(found[0])
+    found = WHP_RE_AALSOB_NO_ALSO.search(txt)
+    if found:
+        return list(found.groups())
     
     return None
 
@@ -680,11 +1313,9 @@ def wordhippo_find_aalsob2(txt):
         link tag ("<b><a[^>]*>([^<]*)</a></b>").
 
     """
-    p1 = r'is also <b><a[^>]*>([^<]*)</a></b>'
-    p2 = r'.*?the plural form can also be <b><a[^>]*>([^<]*)</a></b>'
-    found = re.findall(p1+p2, txt)
-    if len(found) > 0:
-        return list(found[0])
+    found = WHP_RE_AALSOB2.search(txt)
+    if found:
+        return list(found.groups())
     else:
         return None
 
@@ -709,15 +1340,19 @@ def wordhippo_find_also_only(txt):
         If there are multiple matches then it return only the first match found .
 
     """
-    p1 = 'is also <b><a href="/what-is/the-meaning-of-the-word/[^>]*">([^<]*)</a></b>.'
-    found = re.findall(p1, txt)
-    if len(found) == 1:
-        return found
-    elif len(found) > 1:
-        return [found[0]]
+    found = WHP_RE_ALSO_ONLY.search(txt)
+    if found:
+        return [found.group(1)]
     else:
         return None
 
+# one engine for every look-up; the engine keeps settings as attributes, so
+# threads take turns using it
+INFLECT_ENGINE = inflect.engine()
+INFLECT_LOCK = threading.Lock()
+
+# inflect does not go to the web, a disk read would cost as much as its answer
+@cached_lookup('inflect', persist = False)
 def inflect_lookup(noun_lookup):
     """
     This function takes a noun look-up string as input and returns a dictionary
@@ -743,8 +1378,8 @@ def inflect_lookup(noun_lookup):
         pairs.
 
     """
-    engine = inflect.engine()
-    plural = engine.plural(noun_lookup)
+    with INFLECT_LOCK:
+        plural = INFLECT_ENGINE.plural(noun_lookup)
     ret = {}
     ret['query'] = noun_lookup
     ret['plural'] = [plural]
@@ -756,7 +1391,43 @@ def inflect_lookup(noun_lookup):
 # https://www.thoughtco.com/irregular-plural-nouns-in-english-1692634
 # https://www.scientific-editing.info/blog/a-long-list-of-irregular-plural-nouns/
 # only take very small part from scientific-editing
-def sanity_test(website:str):
+SANITY_TEST_LOOKUPS = {
+    'webster': webster_lookup,
+    'wordhippo': wordhippo_lookup,
+    'inflect': inflect_lookup,
+}
+# the look-ups wait on the network, so several words are looked up at once
+SANITY_TEST_WORKERS = 16
+SANITY_TEST_COLUMNS = ('query', 'base', 'plural_1', 'plural_2', 'plural_3')
+
+def sanity_test_probe(word, website):
+    """
+    This function looks up one word of the sanity test suite on a given website.
+
+    Args:
+        word (str): The `word` input parameter is the singular to look up.
+        website (str): The `website` input parameter is one of the keys of
+            `SANITY_TEST_LOOKUPS`.
+
+    Returns:
+        tuple: The output returned by this function is a row of the sanity test
+        result, one value per column of `SANITY_TEST_COLUMNS`; the missing values
+        are None.
+
+    """
+    lookedup = SANITY_TEST_LOOKUPS[website](word)
+
+    if lookedup is None: # cannot access the web, it returns None
+        # we'll continue to try next
+        return (word, None, None, None, None)
+
+    lst_plural = list(lookedup.get('plural', [])) + [None] * 3
+
+    logging.info('finished gettting plurals for %s' % word)
+    return (word, lookedup.get('base', None) or None,
+            lst_plural[0], lst_plural[1], lst_plural[2])
+
+def sanity_test(website:str, max_workers:int = SANITY_TEST_WORKERS):
     """
     This function performs a sanity check on a given website by comparing it to a
     list of known words and their plural forms.
@@ -764,64 +1435,44 @@ def sanity_test(website:str):
     Args:
         website (str): The `website` input parameter specifies which online resource
             to use for looking up the word's plural form.
+        max_workers (int): The `max_workers` input parameter is the number of
+            words looked up at the same time.
 
     Returns:
         : The function does not return anything.
 
     """
-    df = pd.read_csv('sanity_test_irregular.csv', 
-                      header=0)
-    lst_sanity_rslt = []
-    for word in df['singular']:
-        if website == 'webster':
-            lookedup = webster_lookup(word)
-        elif website == 'wordhippo':
-            lookedup = wordhippo_lookup(word)
-        elif website == 'inflect':
-            lookedup = inflect_lookup(word)
-        else:
-            return None
-
-        dict_save = {}
-        dict_save['query'] = word
-        if lookedup is None: # cannot access the web, it returns None
-            lst_sanity_rslt.append(dict_save)
-            # we'll continue to try next
-            continue
-
-        sopo = lookedup.get('base', None)
-        if sopo:
-            dict_save['base'] = sopo
-
-        lst_plural = lookedup.get('plural', [])
-        if len(lst_plural) > 0:
-            dict_save['plural_1'] = lst_plural[0]
-        if len(lst_plural) > 1:
-            dict_save['plural_2'] = lst_plural[1]
-        if len(lst_plural) > 2:
-            dict_save['plural_3'] = lst_plural[2]
-        
-        lst_sanity_rslt.append(dict_save)
-        logging.info('finished gettting plurals for %s' % word)
+    if website not in SANITY_TEST_LOOKUPS:
+        return None
 
-    df_save = pd.DataFrame(lst_sanity_rslt)
-    sanity_result = 'sanity_rslt_' + website + '.csv'
-    try:
-        os.remove(sanity_result)
-    except OSError:
-        pass
-    df_save.to_csv( sanity_result, index = False)
+    with open('sanity_test_irregular.csv', newline = '') as f:
+        words = [row['singular'] for row in csv.DictReader(f)]
+    # map() keeps the rows in the order of the suite
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        rows = list(executor.map(sanity_test_probe, words,
+                                 [website] * len(words)))
+
+    # the rows are already in the order of the columns, csv writes them as they
+    # are (None as an empty field) and the file of a previous run is truncated
+    with open('sanity_rslt_' + website + '.csv', 'w', newline = '') as f:
+        writer = csv.writer(f, lineterminator = '\n')
+        writer.writerow(SANITY_TEST_COLUMNS)
+        writer.writerows(rows)
     return
 
-def sanity_test_all():
+def sanity_test_all(max_workers:int = SANITY_TEST_WORKERS):
     """
     This function tests three different dictionaries (or similar modules) for
     correctness by running a `sanity_test` function on each one.
 
+    Args:
+        max_workers (int): The `max_workers` input parameter is the number of
+            words looked up at the same time by each `sanity_test`.
+
     """
-    sanity_test('webster')
-    sanity_test('wordhippo')
-    sanity_test('inflect')
+    sanity_test('webster', max_workers)
+    sanity_test('wordhippo', max_workers)
+    sanity_test('inflect', max_workers)
     return
 
 # The final user interface
@@ -856,8 +1507,12 @@ def pluc_lookup_plurals(noun:str, strict_level:str = 'dictionary'):
         for the noun.
 
     """
-    webster_lookedup = webster_lookup(noun)
-    wordhippo_lookedup = wordhippo_lookup(noun)
+    # the two dictionaries do not depend on each other, they are asked at once
+    with ThreadPoolExecutor(max_workers = 2) as executor:
+        webster_future = executor.submit(webster_lookup, noun)
+        wordhippo_future = executor.submit(wordhippo_lookup, noun)
+        webster_lookedup = webster_future.result()
+        wordhippo_lookedup = wordhippo_future.result()
 
     if wordhippo_lookedup.get('countable', None):
         webster_lookedup['countable'] = wordhippo_lookedup['countable']
@@ -881,11 +1536,8 @@ def pluc_lookup_plurals(noun:str, strict_level:str = 'dictionary'):
             return wordhippo_lookedup
     else:
         # we will combine what we have to have possible as many plural as possible
-        wst_plu = webster_lookedup.get('plural', [])
-        whp_plu = wordhippo_lookedup.get('plural', [])
-
-        # get the max possible set
-        max_plu = [*set(wst_plu + whp_plu)]
+        # get the max possible set, webster's first, in the order they are given
+        max_plu = list(dict.fromkeys([*wst_plu, *whp_plu]))
         if len(max_plu) > 0:
             ret = {}
             ret['query'] = noun
@@ -902,7 +1554,7 @@ def pluc_lookup_plurals(noun:str, strict_level:str = 'dictionary'):
             return ret
         
         # this is the last resort for strict_level is forced
-        return inflect_lookup()
+        return inflect_lookup(noun)
 
 def main():
     '''for testing'''